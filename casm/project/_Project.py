@@ -2,7 +2,6 @@ import pathlib
 from typing import Optional, TypeVar, Union
 
 import libcasm.casmglobal as casmglobal
-import libcasm.clexulator as casmclex
 import libcasm.configuration as casmconfig
 import libcasm.xtal as xtal
 
@@ -50,12 +49,10 @@ class Project:
         """libcasm.configuration.Prim: Primitive crytal structure and allowed degrees 
         of freedom (DoF) with symmetry information"""
 
-        self.prim_neighbor_list = casmclex.PrimNeighborList(
-            lattice_weight_matrix=self.settings.nlist_weight_matrix,
-            sublattice_indices=self.settings.nlist_sublat_indices,
+        self.prim_neighbor_list = self.settings.make_prim_neighbor_list(
             total_n_sublattice=len(self.prim.xtal_prim.occ_dof()),
         )
-        """casmclex.PrimNeighborList: The :class:`PrimNeighborList` used for 
+        """libcasm.clexulator.PrimNeighborList: The :class:`PrimNeighborList` used for 
         constructing Clexulator.
         
         If the `nlist_weight_matrix` or `nlist_sublat_indices` project settings change,
@@ -146,6 +146,26 @@ class ProjectSettings(object):
             return None
         return ClexDescription(**data["cluster_expansions"][clexname])
 
+    def make_prim_neighbor_list(self, total_n_sublattice: int) -> PrimNeighborList:
+        """Construct the PrimNeighborList specified by the project settings
+
+        Parameters
+        ----------
+        total_n_sublattice: int
+            The total number of sublattices in the prim.
+
+        Returns
+        -------
+        prim_neighbor_list: libcasm.clexulator.PrimNeighborList
+            A PrimNeighborList constructed using `nlist_weight_matrix` and
+            `nlist_sublat_indices`.
+        """
+        return PrimNeighborList(
+            lattice_weight_matrix=self.nlist_weight_matrix,
+            sublattice_indices=self.nlist_sublat_indices,
+            total_n_sublattice=total_n_sublattice,
+        )
+
     @staticmethod
     def make_default(
         xtal_prim: xtal.Prim,
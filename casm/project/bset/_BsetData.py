@@ -1,3 +1,6 @@
+import concurrent.futures
+import multiprocessing
+import os
 import pathlib
 import re
 import sys
@@ -6,37 +9,88 @@ from typing import Optional, TYPE_CHECKING, Union
 
 import numpy as np
 
-from casm.bset import build_cluster_functions, make_clex_basis_specs, write_clexulator
-from casm.bset.cluster_functions import ClexBasisSpecs, ClusterFunctionsBuilder
-from libcasm.clexulator import (
-    Clexulator,
-    LocalClexulator,
-    make_clexulator,
-    make_local_clexulator,
-)
-from libcasm.clusterography import Cluster, ClusterOrbitGenerator
-from libcasm.occ_events import OccEvent
-
 from ._ConfigCorrCalculator import ConfigCorrCalculator
-from ._display_bset import (
-    DisplayBasisOptions,
-    display_functions,
-)
-from ._print_bset import (
-    PrettyPrintBasisOptions,
-    pretty_print_functions,
-    pretty_print_orbits,
-)
 from casm.project.json_io import printpathstr, read_optional, safe_dump
 
 if TYPE_CHECKING:
+    from casm.bset.cluster_functions import ClexBasisSpecs, ClusterFunctionsBuilder
     from casm.project import Project
+    from libcasm.clexulator import Clexulator, LocalClexulator
+    from libcasm.clusterography import Cluster, ClusterOrbitGenerator
+    from libcasm.occ_events import OccEvent
+
+_VALID_ID = re.compile(r"\A\w+\Z")
+
+
+def _count_unique_nonneg(values: np.ndarray) -> int:
+    """Count the distinct values in an array of non-negative integers
+
+    Uses a flag array of size ``max(values) + 1``, which avoids the sort done by
+    ``np.unique`` for the small, dense index ranges of neighbor list indices.
+    """
+    if values.size == 0:
+        return 0
+    flags = np.zeros(values.max() + 1, dtype=bool)
+    flags[values] = True
+    return int(np.count_nonzero(flags))
+
+
+def _file_signature(path: pathlib.Path) -> Optional[tuple[int, int, int]]:
+    """Return the inode, modification time, and size of a file, or None if it does not
+    exist"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _compile_clexulator(
+    source: str,
+    settings_data: dict,
+    total_n_sublattice: int,
+):
+    """Compile a Clexulator in a worker process
+
+    The Clexulator itself is discarded; this is called for the side effect of
+    writing the compiled library next to `source`, so that it is loaded rather than
+    re-compiled later. The PrimNeighborList cannot be passed between processes, so
+    it is re-constructed from the project settings, as by the Project.
+    """
+    from casm.project._ProjectSettings import ProjectSettings
+    from libcasm.clexulator import make_clexulator
+
+    settings = ProjectSettings.from_dict(settings_data)
+    make_clexulator(
+        source=source,
+        prim_neighbor_list=settings.make_prim_neighbor_list(
+            total_n_sublattice=total_n_sublattice,
+        ),
+    )
+
+
+def _build_jobs_from_env() -> int:
+    """Return the number of processes to compile with, as set by the environment
+    variable ``CASM_BUILD_JOBS``, or 1 if it is not set or not a positive integer"""
+    value = os.environ.get("CASM_BUILD_JOBS", "").strip()
+    if not value:
+        return 1
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        print(f"Warning: ignoring CASM_BUILD_JOBS={value!r}, expected an integer")
+        return 1
 
 
 class BsetOutputData:
     """Reads basis set data from the files generated by
     :func:`BsetData.update <casm.project.BsetData.update>`.
 
+    Data is read from disk on first access and then cached. On each access the
+    file's inode, modification time, and size are checked, and the file is re-read if
+    it has changed, so that separate BsetOutputData for the same basis set agree.
+    Call :func:`invalidate` to clear the cache.
+
     """
 
     def __init__(self, proj: "Project", id: str):
@@ -49,6 +103,40 @@ class BsetOutputData:
         self.bset_dir = self.proj.dir.bset_dir(bset=id)
         """pathlib.Path: Basis set directory"""
 
+        self._cache = dict()
+        """dict[str, tuple]: Data read from generated files, as (file signature,
+        data), and data derived from it, as (source data, derived data)"""
+
+    def invalidate(self):
+        """Clear data cached from generated files, so that it is re-read from disk
+        on next access"""
+        self._cache.clear()
+
+    def _read(self, relpath: str, gz: bool = False):
+        """Read a generated file, reusing the data already read if the file has not
+        changed since
+
+        Returns None if the file does not exist.
+        """
+        path = self.bset_dir / relpath
+        signature = _file_signature(path)
+        cached = self._cache.get(relpath)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        data = read_optional(path, gz=gz)
+        self._cache[relpath] = (signature, data)
+        return data
+
+    def _derive(self, name: str, source, make):
+        """Return ``make(source)``, reusing the value made from the same `source`
+        object, which is the data read by :func:`_read`"""
+        cached = self._cache.get(name)
+        if cached is not None and cached[0] is source:
+            return cached[1]
+        value = make(source)
+        self._cache[name] = (source, value)
+        return value
+
     ### Data from generated files (load only) ###
     # written by write_clexulator
 
@@ -59,39 +147,86 @@ class BsetOutputData:
         See the CASM documentation for the
         `basis.json format <https://prisms-center.github.io/CASMcode_docs/formats/casm/clex/ClexBasis/>`_.
         """
-        return read_optional(self.bset_dir / "basis.json")
+        return self._read("basis.json")
 
     @property
-    def prototype_clusters(self) -> list[Cluster]:
-        """list[Cluster]: The prototype cluster, for each basis function"""
-        orbits = self.basis_dict.get("orbits")
-        _prototype_clusters = []
-        for orbit in orbits:
-            _prototype = Cluster.from_dict(
-                data=orbit.get("prototype"),
-                prim=self.proj.prim.xtal_prim(),
-            )
-            for func in orbit.get("cluster_functions"):
-                _prototype_clusters.append(_prototype)
-        return _prototype_clusters
+    def orbit_prototype_clusters(self) -> "list[Cluster]":
+        """list[Cluster]: The prototype cluster, for each orbit"""
+
+        def _make(basis_dict):
+            from libcasm.clusterography import Cluster
+
+            xtal_prim = self.proj.prim.xtal_prim
+            return [
+                Cluster.from_dict(data=orbit.get("prototype"), xtal_prim=xtal_prim)
+                for orbit in basis_dict.get("orbits")
+            ]
+
+        return self._derive("orbit_prototype_clusters", self.basis_dict, _make)
+
+    @property
+    def function_orbit_index(self) -> np.ndarray:
+        """numpy.ndarray[numpy.int[n_functions]]: The linear orbit index, for each
+        basis function"""
+        n_functions = self._orbit_arrays["n_functions"]
+        return np.repeat(np.arange(len(n_functions)), n_functions)
+
+    @property
+    def prototype_clusters(self) -> "list[Cluster]":
+        """list[Cluster]: The prototype cluster, for each basis function
+
+        Functions on the same orbit share the same Cluster object, as given by
+        :attr:`orbit_prototype_clusters`.
+        """
+        _orbit_prototype_clusters = self.orbit_prototype_clusters
+        return [
+            _orbit_prototype_clusters[i] for i in self.function_orbit_index.tolist()
+        ]
+
+    @property
+    def _orbit_arrays(self) -> dict[str, np.ndarray]:
+        """dict[str, np.ndarray]: Per-orbit data, read in a single pass over the
+        orbits in :attr:`basis_dict`
+
+        - `mult`: The number of clusters in each orbit
+        - `size`: The number of sites in the prototype cluster of each orbit
+        - `n_functions`: The number of cluster functions for each orbit
+        """
+
+        def _make(basis_dict):
+            mult = []
+            size = []
+            n_functions = []
+            for orbit in basis_dict.get("orbits"):
+                mult.append(orbit.get("mult"))
+                size.append(len(orbit.get("prototype").get("sites")))
+                n_functions.append(len(orbit.get("cluster_functions")))
+            return {
+                "mult": np.array(mult, dtype=int),
+                "size": np.array(size, dtype=int),
+                "n_functions": np.array(n_functions, dtype=int),
+            }
+
+        return self._derive("_orbit_arrays", self.basis_dict, _make)
 
     @property
     def cluster_multiplicity(self):
-        """np.ndarray[numpy.float[n_functions]]: The number of clusters per orbit, for
+        """np.ndarray[numpy.int[n_functions]]: The number of clusters per orbit, for
         each basis function"""
-        orbits = self.basis_dict.get("orbits")
-        mult = []
-        for orbit in orbits:
-            _mult = orbit.get("mult")
-            for func in orbit.get("cluster_functions"):
-                mult.append(_mult)
-        return np.array(mult, dtype=int)
+        x = self._orbit_arrays
+        return np.repeat(x["mult"], x["n_functions"])
 
     @property
     def cluster_size(self) -> np.ndarray:
         """numpy.ndarray[numpy.int[n_functions]]: The number of cluster sites, for each
         basis function"""
-        return np.array([len(x) for x in self.cluster_prototypes], dtype=int)
+        x = self._orbit_arrays
+        return np.repeat(x["size"], x["n_functions"])
+
+    @property
+    def n_functions(self) -> int:
+        """int: The total number of basis functions"""
+        return int(self._orbit_arrays["n_functions"].sum())
 
     @property
     def equivalents_info(self):
@@ -106,7 +241,7 @@ class BsetOutputData:
         See the CASM documentation for the
         `equivalents_info.json format <TODO>`_.
         """
-        self.equivalents_info = read_optional(self.bset_dir / "equivalents_info.json")
+        return self._read("equivalents_info.json")
 
     @property
     def generated_files(self):
@@ -122,29 +257,38 @@ class BsetOutputData:
         :attr:`BsetData.bset_dir <casm.project.BsetData.bset_dir>`
 
         """
-        return read_optional(self.bset_dir / "generated_files.json")
+        return self._read("generated_files.json")
+
+    @property
+    def _generated_paths(self):
+        """tuple[Optional[pathlib.Path], Optional[list[pathlib.Path]]]: The
+        Clexulator source file path and local Clexulator source file paths"""
+
+        def _make(generated_files):
+            if generated_files is None:
+                return (None, None)
+            src_path = generated_files.get("src_path")
+            if src_path is not None:
+                src_path = self.bset_dir / src_path
+            local_src_path = generated_files.get("local_src_path")
+            if local_src_path is not None:
+                local_src_path = [self.bset_dir / p for p in local_src_path]
+            return (src_path, local_src_path)
+
+        return self._derive("_generated_paths", self.generated_files, _make)
 
     @property
     def src_path(self):
         """Optional[pathlib.Path]: Clexulator source file path"""
-        x = self.generated_files
-        if x is None:
-            return None
-        y = x.get("src_path")
-        if y is None:
-            return None
-        return self.bset_dir / y
+        return self._generated_paths[0]
 
     @property
     def local_src_path(self):
         """Optional[list[pathlib.Path]]: Local Clexulator source file paths"""
-        x = self.generated_files
-        if x is None:
-            return None
-        y = x.get("local_src_path")
-        if y is None:
+        local_src_path = self._generated_paths[1]
+        if local_src_path is None:
             return None
-        return [self.bset_dir / p for p in y]
+        return list(local_src_path)
 
     @property
     def variables(self):
@@ -156,21 +300,29 @@ class BsetOutputData:
         - For version `v1.basic`: :class:`~casm.bset.clexwriter.WriterV1Basic`
         - For version `v1.diff`: :class:`~casm.bset.clexwriter.WriterV1Diff` (TODO)
         """
-        return read_optional(self.bset_dir / "variables.json.gz", gz=True)
+        return self._read("variables.json.gz", gz=True)
 
-    @property
     def local_variables(self, i_equiv: int):
-        """Optional[list[dict]]: Variables used to write LocalClexulator
+        """Variables used to write a LocalClexulator
 
         Values in these files correspond to documented attributes of the class used
         to write the Clexulator, which depends on the version:
 
         - For version `v1.basic`: :class:`~casm.bset.clexwriter.WriterV1Basic`
         - For version `v1.diff`: :class:`~casm.bset.clexwriter.WriterV1Diff` (TODO)
+
+        Parameters
+        ----------
+        i_equiv: int
+            The index of the equivalent local basis set.
+
+        Returns
+        -------
+        local_variables: Optional[dict]
+            The variables used to write the `i_equiv`-th LocalClexulator, if
+            available; otherwise None.
         """
-        return read_optional(
-            self.bset_dir / str(i_equiv) / "variables.json.gz", gz=True
-        )
+        return self._read(f"{i_equiv}/variables.json")
 
 
 class BsetData:
@@ -192,10 +344,10 @@ class BsetData:
                 ├── <projectname>_Clexulator_<id>.json
                 ├── 0/
                 │   ├── <projectname>_Clexulator_<id>_0.cpp
-                │   └── variables.json.gz
+                │   └── variables.json
                 ├── 1/
                 │   └── <projectname>_Clexulator_<id>_1.cpp
-                │   └── variables.json.gz
+                │   └── variables.json
                 ...
 
     Input files summary:
@@ -223,9 +375,10 @@ class BsetData:
       matrix representations used to construct the functions. Values in this file
       correspond to documented attributes of
       :class:`~casm.bset.cluster_functions.ClusterFunctionsBuilder`.
-    - `variables.json.gz`: A file for each Clexulator (including local Clexulator) which
-      contains the variables used by the jinja2 templates as well as information like
-      basis function formulas generated during the write process. Values in this file
+    - `variables.json.gz`: A file for the Clexulator or prototype local Clexulator, and
+      `<equivalent_index>/variables.json` for each equivalent local Clexulator, which
+      contain the variables used by the jinja2 templates as well as information like
+      basis function formulas generated during the write process. Values in these files
       correspond to documented attributes of the following classes:
 
       - For version `v1.basic`: :class:`~casm.bset.clexwriter.WriterV1Basic`
@@ -242,13 +395,11 @@ class BsetData:
     """
 
     def __init__(self, proj: "Project", id: str):
-        if not re.match(
-            R"^\w+",
-            id,
-        ):
+        if not _VALID_ID.match(id):
             raise Exception(
-                f"id='{id}' is not a valid basis set name: ",
-                "Must consist alphanumeric characters and underscores only.",
+                f"id='{id}' is not a valid basis set name: "
+                "The entire name must consist of alphanumeric characters and "
+                "underscores only."
             )
 
         self.proj = proj
@@ -298,6 +449,13 @@ class BsetData:
         """Optional[casm.project.BsetOutputData]: Output data generated by the 
         :func:`~casm.project.BsetData.update` method."""
 
+        self._clexulator_cache = dict()
+        """dict: Clexulator and LocalClexulator already constructed by
+        :func:`~casm.project.BsetData.make_clexulator` and
+        :func:`~casm.project.BsetData.make_local_clexulator`, as (source file
+        signatures, PrimNeighborList, Clexulator). Entries are only reused for the
+        same, unchanged source files and the same PrimNeighborList object."""
+
         self.load()
 
     def load(self):
@@ -316,6 +474,8 @@ class BsetData:
         path = self.proj.dir.bspecs(bset=self.id)
         data = read_optional(path, default=None)
         if data is not None:
+            from casm.bset.cluster_functions import ClexBasisSpecs
+
             self.clex_basis_specs = ClexBasisSpecs.from_dict(
                 data=data,
                 prim=self.proj.prim,
@@ -340,6 +500,7 @@ class BsetData:
         - If an attribute is None, the corresponding file will be deleted.
 
         """
+        from casm.bset.cluster_functions import ClexBasisSpecs
 
         # validate clex_basis_specs
         if not isinstance(self.clex_basis_specs, ClexBasisSpecs):
@@ -386,8 +547,12 @@ class BsetData:
             path.unlink()
 
             path = self.bset_dir / "writer_params.json"
-            print(f"Removing {printpathstr(path)}")
-            path.unlink()
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            else:
+                print(f"Removing {printpathstr(path)}")
 
         # write meta.json:
         path = self.bset_dir / "meta.json"
@@ -408,6 +573,8 @@ class BsetData:
     def clean(self, verbose: bool = True):
         """Remove all generated files associated with the basis set, as read from
         generated_files.json"""
+        self._clexulator_cache.clear()
+
         # read generated_files.json if it exists
         generated_files = self.out.generated_files
 
@@ -423,10 +590,13 @@ class BsetData:
         files = generated_files.get("all", [])
         for file in files:
             path = self.bset_dir / file
-            if path.exists():
-                if verbose:
-                    print(f"- Removing {printpathstr(path)}")
+            try:
                 path.unlink()
+            except FileNotFoundError:
+                continue
+            if verbose:
+                print(f"- Removing {printpathstr(path)}")
+        self.out.invalidate()
 
         if verbose:
             print()
@@ -444,25 +614,33 @@ class BsetData:
             s += "- (No basis set specifications)"
             return s
 
-        clexulator = self.make_clexulator()
-        if clexulator is None:
-            s += "- (No Clexulator, requires `update`)"
-            return s
-        n_functions = clexulator.n_functions()
+        # avoid compiling the Clexulator just to count functions
+        if self.out.basis_dict is not None:
+            n_functions = self.out.n_functions
+        else:
+            clexulator = self.make_clexulator()
+            if clexulator is None:
+                s += "- (No Clexulator, requires `update`)"
+                return s
+            n_functions = clexulator.n_functions()
 
         variables = self.out.variables
         variables_needed = variables.get("orbit_bfuncs_variables_needed", {})
-        nbor_needed = set()
-        for key, value in variables_needed.items():
-            for component_index, nbor_index, sublattice_index in value:
-                if nbor_index is not None:
-                    nbor_needed.add(nbor_index)
-        n_update_neighborhood_sites = len(
-            variables.get("complete_neighborhood", {}).get("sites", None)
+        nbor_needed = np.fromiter(
+            (
+                nbor_index
+                for value in variables_needed.values()
+                for component_index, nbor_index, sublattice_index in value
+                if nbor_index is not None
+            ),
+            dtype=int,
         )
+        n_sites = _count_unique_nonneg(nbor_needed)
+        sites = variables.get("complete_neighborhood", {}).get("sites") or []
+        n_update_neighborhood_sites = len(sites)
 
         s += f"- n_functions: {n_functions}\n"
-        s += f"- n_sites: {len(nbor_needed)}\n"  # sites involved in eval orbit funcs
+        s += f"- n_sites: {n_sites}\n"  # sites involved in eval orbit funcs
         if len(variables_needed) == 0:  # vars involved in eval orbit funcs
             s += "- n_variables: (none)\n"
         else:
@@ -476,7 +654,7 @@ class BsetData:
 
     def set_bspecs(
         self,
-        clex_basis_specs: ClexBasisSpecs,
+        clex_basis_specs: "ClexBasisSpecs",
     ):
         """Set :attr:`~casm.project.BsetData.clex_basis_specs`
 
@@ -492,8 +670,8 @@ class BsetData:
         self,
         dofs: Optional[list[str]] = None,
         max_length: Optional[list[float]] = [],
-        custom_generators: Optional[list[ClusterOrbitGenerator]] = [],
-        phenomenal: Union[Cluster, OccEvent, None] = None,
+        custom_generators: Optional["list[ClusterOrbitGenerator]"] = [],
+        phenomenal: Union["Cluster", "OccEvent", None] = None,
         cutoff_radius: Optional[list[float]] = [],
         occ_site_basis_functions_specs: Union[str, list[dict], None] = None,
         global_max_poly_order: Optional[int] = None,
@@ -560,6 +738,8 @@ class BsetData:
             size using `orbit_branch_max_poly_order` or globally using
             `global_max_poly_order`. The most specific level specified is used.
         """
+        from casm.bset import make_clex_basis_specs
+
         self.clex_basis_specs = make_clex_basis_specs(
             prim=self.proj.prim,
             dofs=dofs,
@@ -577,7 +757,7 @@ class BsetData:
         make_equivalents: bool = True,
         make_all_local_basis_sets: bool = True,
         verbose: bool = False,
-    ) -> ClusterFunctionsBuilder:
+    ) -> "ClusterFunctionsBuilder":
         """Construct the cluster functions for the basis set, but do not write anything
 
         This uses the current basis set specifications to construct clusters and
@@ -616,6 +796,8 @@ class BsetData:
                 "project prim_neighbor_list is None"
             )
 
+        from casm.bset import build_cluster_functions
+
         return build_cluster_functions(
             prim=self.proj.prim,
             clex_basis_specs=self.clex_basis_specs,
@@ -631,6 +813,7 @@ class BsetData:
         only_compile: bool = False,
         verbose: bool = True,
         very_verbose: bool = False,
+        n_jobs: Optional[int] = None,
     ):
         """Write the Clexulator source file(s) for the basis set, and/or compile the
         Clexulator(s)
@@ -650,6 +833,11 @@ class BsetData:
             Print progress statements
         very_verbose: bool = False
             Print detailed progress statements from the cluster functions builder.
+        n_jobs: Optional[int] = None
+            The maximum number of processes used to compile the equivalent local
+            Clexulators. If None, the value of the environment variable
+            ``CASM_BUILD_JOBS`` is used, if it is set, and otherwise 1. Periodic
+            Clexulators are always compiled in the current process.
         """
         if self.proj.prim_neighbor_list is None:
             raise Exception(
@@ -662,10 +850,12 @@ class BsetData:
                 "no basis set specifications found"
             )
         if only_compile is False:
+            from casm.bset import write_clexulator
+
             self.clean(verbose=verbose)
 
             if verbose:
-                start = time.time()
+                start = time.perf_counter()
                 print("Generating clexulator...")
                 sys.stdout.flush()
             write_clexulator(
@@ -681,16 +871,19 @@ class BsetData:
                 verbose=verbose,
                 very_verbose=very_verbose,
             )
+            self.out.invalidate()
             if verbose:
-                print("Generated files:")
+                elapsed_time = time.perf_counter() - start
+                lines = ["Generated files:"]
                 for file in self.out.generated_files.get("all", []):
-                    print(f"- {printpathstr(self.bset_dir / file)}")
-                print()
-                print("Generating clexulator DONE")
-                elapsed_time = time.time() - start
-                print(f"generation time: {elapsed_time:0.4f} (s)")
-                print()
-                sys.stdout.flush()
+                    lines.append(f"- {printpathstr(self.bset_dir / file)}")
+                lines += [
+                    "",
+                    "Generating clexulator DONE",
+                    f"generation time: {elapsed_time:0.4f} (s)",
+                    "",
+                ]
+                print("\n".join(lines), flush=True)
 
         if no_compile:
             return
@@ -712,37 +905,71 @@ class BsetData:
             if verbose:
                 print("Compiling local clexulator...")
                 sys.stdout.flush()
+            if n_jobs is None:
+                n_jobs = _build_jobs_from_env()
+            self._compile_local_clexulators(n_jobs=n_jobs)
             _ = self.make_local_clexulator()
             if verbose:
                 print("Compiling local clexulator DONE")
                 sys.stdout.flush()
 
+    def _compile_local_clexulators(self, n_jobs: int):
+        """Compile the equivalent local Clexulators in parallel
+
+        Does nothing if `n_jobs` <= 1 or there is only one equivalent, in which case
+        :func:`~casm.project.BsetData.make_local_clexulator` compiles them serially.
+        """
+        local_src_path = self.out.local_src_path
+        if local_src_path is None or n_jobs <= 1 or len(local_src_path) <= 1:
+            return
+        settings_data = self.proj.settings.to_dict()
+        total_n_sublattice = len(self.proj.prim.xtal_prim.occ_dof())
+        max_workers = min(n_jobs, len(local_src_path), os.cpu_count() or 1)
+        # spawn, rather than fork, so workers do not inherit libcasm state or locks
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _compile_clexulator,
+                    str(path),
+                    settings_data,
+                    total_n_sublattice,
+                )
+                for path in local_src_path
+            ]
+            for future in futures:
+                future.result()
+
     def _update_generated_files(self, abspaths: list[pathlib.Path]):
         """Update the generated_files.json file with the given absolute paths"""
         generated_files = self.out.generated_files
         if generated_files is None:
             generated_files = {"all": []}
         relpaths = [str(p.relative_to(self.bset_dir)) for p in abspaths]
-        changed = False
-        for relpath in relpaths:
-            if relpath not in generated_files["all"]:
-                generated_files["all"].append(relpath)
-                changed = True
-        if changed:
+        before = generated_files["all"]
+        if not set(relpaths).issubset(before):
+            # copy, rather than modify the data cached by self.out
+            generated_files = dict(generated_files)
+            generated_files["all"] = sorted(set(before).union(relpaths))
             safe_dump(
                 data=generated_files,
                 path=self.bset_dir / "generated_files.json",
                 quiet=False,
                 force=True,
             )
+            self.out.invalidate()
             print()
 
-    def make_clexulator(self) -> Optional[Clexulator]:
+    def make_clexulator(self) -> Optional["Clexulator"]:
         """The Clexulator for the basis set, if available.
 
         When accessed, the Clexulator will be compiled if it has not yet been compiled,
         but it will not be written without explicitly calling
-        :func:`~casm.project.Bset.update`.
+        :func:`~casm.project.Bset.update`. Printing a BsetData does not compile the
+        Clexulator if `basis.json` exists, so this method must be called to force
+        compilation.
 
         Returns
         -------
@@ -752,9 +979,25 @@ class BsetData:
         src_path = self.out.src_path
         if src_path is None:
             return None
+        signature = (str(src_path), _file_signature(src_path))
+        prim_neighbor_list = self.proj.prim_neighbor_list
+        cached = self._clexulator_cache.get("clexulator")
+        if (
+            cached is not None
+            and cached[0] == signature
+            and cached[1] is prim_neighbor_list
+        ):
+            return cached[2]
+        from libcasm.clexulator import make_clexulator
+
         clexulator = make_clexulator(
             source=str(src_path),
-            prim_neighbor_list=self.proj.prim_neighbor_list,
+            prim_neighbor_list=prim_neighbor_list,
+        )
+        self._clexulator_cache["clexulator"] = (
+            signature,
+            prim_neighbor_list,
+            clexulator,
         )
 
         self._update_generated_files(
@@ -766,7 +1009,7 @@ class BsetData:
 
         return clexulator
 
-    def make_local_clexulator(self) -> Optional[LocalClexulator]:
+    def make_local_clexulator(self) -> Optional["LocalClexulator"]:
         """The LocalClexulator for the basis set, if available.
 
         When accessed, the LocalClexulator will be compiled if it has not yet been
@@ -781,21 +1024,34 @@ class BsetData:
         local_src_path = self.out.local_src_path
         if local_src_path is None:
             return None
+        signature = tuple(
+            (str(p), _file_signature(p)) for p in [self.out.src_path] + local_src_path
+        )
+        prim_neighbor_list = self.proj.prim_neighbor_list
+        cached = self._clexulator_cache.get("local_clexulator")
+        if (
+            cached is not None
+            and cached[0] == signature
+            and cached[1] is prim_neighbor_list
+        ):
+            return cached[2]
+        from libcasm.clexulator import make_local_clexulator
+
         local_clexulator = make_local_clexulator(
             source=str(self.out.src_path),
-            prim_neighbor_list=self.proj.prim_neighbor_list,
+            prim_neighbor_list=prim_neighbor_list,
+        )
+        self._clexulator_cache["local_clexulator"] = (
+            signature,
+            prim_neighbor_list,
+            local_clexulator,
         )
 
+        # the compiled files are written next to each equivalent's source file,
+        # <i_equiv>/<projectname>_Clexulator_<id>_<i_equiv>.(o|so)
         abspaths = []
-        for i_equiv, path in enumerate(local_src_path):
-            abspaths += [
-                self.proj.dir.clexulator_o(
-                    projectname=self.proj.name, bset=self.id, i_equiv=i_equiv
-                ),
-                self.proj.dir.clexulator_so(
-                    projectname=self.proj.name, bset=self.id, i_equiv=i_equiv
-                ),
-            ]
+        for path in local_src_path:
+            abspaths += [path.with_suffix(".o"), path.with_suffix(".so")]
 
         self._update_generated_files(abspaths=abspaths)
 
@@ -827,11 +1083,22 @@ class BsetData:
                 raise Exception("No basis.json. Do you need to run update?.")
 
         return ConfigCorrCalculator(
-            clexulator=self.make_clexulator(),
+            clexulator=clexulator,
             prim_neighbor_list=self.proj.prim_neighbor_list,
             linear_function_indices=linear_function_indices,
         )
 
+    def _require(self, attr: str, filename: str):
+        """Return ``getattr(self.out, attr)``, or raise if the generated file
+        `filename` it is read from does not exist"""
+        value = getattr(self.out, attr)
+        if value is None:
+            if self.clex_basis_specs is None:
+                raise Exception(f"No {filename}. No basis set specifications.")
+            else:
+                raise Exception(f"No {filename}. Do you need to run update?.")
+        return value
+
     def print_orbits(
         self,
         linear_orbit_indices: Optional[set[int]] = None,
@@ -839,12 +1106,9 @@ class BsetData:
         invariant_group_coordinate_mode: str = "cart",
         site_coordinate_mode: str = "integral",
     ):
-        basis_dict = self.out.basis_dict
-        if basis_dict is None:
-            if self.clex_basis_specs is None:
-                raise Exception("No basis.json. No basis set specifications.")
-            else:
-                raise Exception("No basis.json. Do you need to run update?.")
+        from ._print_bset import PrettyPrintBasisOptions, pretty_print_orbits
+
+        basis_dict = self._require("basis_dict", "basis.json")
 
         options = PrettyPrintBasisOptions()
         options.linear_orbit_indices = linear_orbit_indices
@@ -866,12 +1130,9 @@ class BsetData:
         invariant_group_coordinate_mode: str = "cart",
         site_coordinate_mode: str = "integral",
     ):
-        basis_dict = self.out.basis_dict
-        if basis_dict is None:
-            if self.clex_basis_specs is None:
-                raise Exception("No basis.json. No basis set specifications.")
-            else:
-                raise Exception("No basis.json. Do you need to run update?.")
+        from ._print_bset import PrettyPrintBasisOptions, pretty_print_orbits
+
+        basis_dict = self._require("basis_dict", "basis.json")
 
         options = PrettyPrintBasisOptions()
         options.linear_orbit_indices = linear_orbit_indices
@@ -894,25 +1155,10 @@ class BsetData:
         print_prototypes: bool = False,
         site_coordinate_mode: str = "integral",
     ):
-        # basis_dict = self.out.basis_dict
-        # if basis_dict is None:
-        #     if self.clex_basis_specs is None:
-        #         raise Exception("No basis.json. No basis set specifications.")
-        #     else:
-        #         raise Exception("No basis.json. Do you need to run update?.")
+        from ._print_bset import PrettyPrintBasisOptions, pretty_print_functions
 
-        variables = self.out.variables
-        if variables is None:
-            if self.clex_basis_specs is None:
-                raise Exception("No variables.json.gz. No basis set specifications.")
-            else:
-                raise Exception("No variables.json.gz. Do you need to run update?.")
-        basis_dict = self.out.basis_dict
-        if basis_dict is None:
-            if self.clex_basis_specs is None:
-                raise Exception("No basis.json. No basis set specifications.")
-            else:
-                raise Exception("No basis.json. Do you need to run update?.")
+        variables = self._require("variables", "variables.json.gz")
+        basis_dict = self._require("basis_dict", "basis.json")
 
         options = PrettyPrintBasisOptions()
         options.linear_orbit_indices = linear_orbit_indices
@@ -953,12 +1199,9 @@ class BsetData:
             functions are printed for all cluster orbits.
 
         """
-        basis_dict = self.out.basis_dict
-        if basis_dict is None:
-            if self.clex_basis_specs is None:
-                raise Exception("No basis.json. No basis set specifications.")
-            else:
-                raise Exception("No basis.json. Do you need to run update?.")
+        from ._display_bset import DisplayBasisOptions, display_functions
+
+        basis_dict = self._require("basis_dict", "basis.json")
 
         options = DisplayBasisOptions()
         options.linear_orbit_indices = linear_orbit_indices
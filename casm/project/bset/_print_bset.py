@@ -160,31 +160,26 @@ def pretty_print_cluster(
         )
         indices = cluster.get("invariant_group")
 
+        if options.invariant_group_coordinate_mode not in ["cart", "frac"]:
+            raise ValueError(
+                f"Invalid coordinate mode: {options.invariant_group_coordinate_mode}"
+            )
+        use_cart = options.invariant_group_coordinate_mode == "cart"
+        lattice = prim.xtal_prim.lattice()
+        factor_group_elements = prim.factor_group.elements
+
         cluster_group = SymGroup.from_elements(
-            elements=[prim.factor_group.elements[i] for i in indices],
-            lattice=prim.xtal_prim.lattice(),
+            elements=[factor_group_elements[i] for i in indices],
+            lattice=lattice,
             sort=False,
         )
+        head_group_index = cluster_group.head_group_index
 
         # desc = cluster.get("invariant_group_descriptions")
-        i_cg = 0
-        for op in cluster_group.elements:
-            info = xtal.SymInfo(
-                op=op,
-                lattice=prim.xtal_prim.lattice(),
-            )
-            i_fg = cluster_group.head_group_index[i_cg]
-            if options.invariant_group_coordinate_mode == "cart":
-                desc = info.brief_cart()
-            elif options.invariant_group_coordinate_mode == "frac":
-                desc = info.brief_frac()
-            else:
-                raise ValueError(
-                    f"Invalid coordinate mode: "
-                    f"{options.invariant_group_coordinate_mode}"
-                )
-            print(f"  - {i_cg} ({i_fg}): {desc}", file=out)
-            i_cg += 1
+        for i_cg, op in enumerate(cluster_group.elements):
+            info = xtal.SymInfo(op=op, lattice=lattice)
+            desc = info.brief_cart() if use_cart else info.brief_frac()
+            print(f"  - {i_cg} ({head_group_index[i_cg]}): {desc}", file=out)
 
 
 def pretty_print_orbit(
@@ -1,9 +1,6 @@
 import sys
 from typing import Optional, TextIO
 
-import numpy as np
-
-import libcasm.configuration as casmconfig
 import libcasm.xtal as xtal
 from casm.project._Project import Project
 from libcasm.sym_info import SymGroup
@@ -58,14 +55,7 @@ class SymCommand:
     ):
         """Print the lattice point group"""
         lat = self.proj.prim.xtal_prim.lattice()
-        _tmp_prim = casmconfig.Prim(
-            xtal_prim=xtal.Prim(
-                lattice=lat,
-                coordinate_frac=np.zeros((3, 1)),
-                occ_dof=[["X"]],
-            ),
-        )
-        _print_symgroup(_tmp_prim.factor_group, lat, coord, index_from)
+        _print_symgroup(self.proj.prim.lattice_point_group, lat, coord, index_from)
 
     def print_factor_group(
         self,
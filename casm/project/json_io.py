@@ -1,4 +1,6 @@
+import functools
 import gzip
+import io
 import json
 import os
 import pathlib
@@ -7,6 +9,20 @@ from typing import Any, Union
 
 import libcasm.xtal as xtal
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# zlib's default level; gzip.open defaults to 9, which is much slower to write
+_GZ_COMPRESSLEVEL = 6
+
+# json.dump writes many small chunks; buffer them to reduce write syscalls
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Only uncompressed files and .tgz members up to this size, in bytes, are cached
+_CACHE_MAX_FILE_SIZE = 1024 * 1024
+
 
 def pretty_json(
     data: dict,
@@ -23,19 +39,114 @@ def printpathstr(path):
         return str(abspath)
 
 
+def _loads(data: bytes):
+    """Parse JSON from bytes, using orjson if it is available"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects some input that json accepts, such as NaN
+            pass
+    return json.loads(data)
+
+
+def _write_compact_json(data, f):
+    """Write data as compact JSON to the binary file object `f`
+
+    Data is streamed to `f` by json.dump without first building the entire JSON
+    string. json is used even if orjson is available, so that the output, including
+    NaN and infinite values, non-str keys, and large ints, does not depend on
+    which optional packages are installed.
+    """
+    w = io.TextIOWrapper(f, encoding="utf-8")
+    json.dump(data, w)
+    w.flush()
+    w.detach()
+
+
+@functools.lru_cache(maxsize=32)
+def _read_bytes(abspath: str, ino: int, mtime_ns: int, size: int, gz: bool) -> bytes:
+    """Read file contents, decompressed if `gz` is True
+
+    The inode, modification time, and size are part of the cache key so that
+    contents are re-read after a file is re-written. The raw bytes are cached,
+    rather than the parsed data, so that each caller gets its own copy of the data.
+    """
+    with open(abspath, "rb") as f:
+        data = f.read()
+    if gz is True:
+        return gzip.decompress(data)
+    return data
+
+
+def _read_json(path: pathlib.Path, gz: bool = False):
+    """Read a JSON file, or a gzipped JSON file if `gz` is True
+
+    Small uncompressed files, such as project and basis set metadata, are cached.
+    Gzipped files and files larger than `_CACHE_MAX_FILE_SIZE` are read directly,
+    so the cache holds at most 32 small files.
+
+    Raises FileNotFoundError if the file does not exist.
+    """
+    st = os.stat(path)
+    args = (os.path.abspath(path), st.st_ino, st.st_mtime_ns, st.st_size, gz)
+    if gz is True or st.st_size > _CACHE_MAX_FILE_SIZE:
+        data = _read_bytes.__wrapped__(*args)
+    else:
+        data = _read_bytes(*args)
+    return _loads(data)
+
+
+def clear_cache():
+    """Clear the cached file contents used by the read functions
+
+    Cached contents are re-read automatically when a file changes, so this is only
+    needed to release memory.
+    """
+    _read_bytes.cache_clear()
+    _tgz_member_size.cache_clear()
+    _read_tgz_member.cache_clear()
+
+
 def read_required(path: pathlib.Path, gz: bool = False):
     path = pathlib.Path(path)
-    if path.exists():
-        if gz is True:
-            with gzip.open(path, "r") as f:
-                return json.loads(f.read().decode("utf-8"))
-        else:
-            with open(path, "r") as f:
-                return json.load(f)
-    else:
+    try:
+        return _read_json(path, gz=gz)
+    except FileNotFoundError:
         raise Exception("Required file: '" + printpathstr(path) + "' does not exist")
 
 
+@functools.lru_cache(maxsize=256)
+def _tgz_member_size(
+    abspath: str, ino: int, mtime_ns: int, size: int, membername: str
+) -> int:
+    """Return the size, in bytes, of a .tgz archive member
+
+    Only the member's size is cached, so that it can be checked against
+    `_CACHE_MAX_FILE_SIZE` without re-opening the archive.
+    """
+    with tarfile.open(abspath, "r:gz") as tar:
+        return tar.getmember(membername).size
+
+
+@functools.lru_cache(maxsize=32)
+def _read_tgz_member(
+    abspath: str, ino: int, mtime_ns: int, size: int, membername: str, gz: bool
+) -> bytes:
+    """Read the contents of a .tgz archive member, decompressed if `gz` is True
+
+    The archive's inode, modification time, and size are part of the cache key so
+    that members are re-read after the archive changes. Each read opens its own
+    TarFile, so concurrent reads do not share a file position.
+    """
+    with tarfile.open(abspath, "r:gz") as tar:
+        with tar.extractfile(membername) as g:
+            data = g.read()
+    if gz is True:
+        return gzip.decompress(data)
+    return data
+
+
 def read_contents(
     parent_dir: pathlib.Path,
     relpath: pathlib.Path,
@@ -67,24 +178,27 @@ def read_contents(
 
     try:
         if datafile_path.exists():
-            if relpath.suffix == ".gz":
-                # gzipped JSON file
-                with gzip.open(datafile_path, "rb") as f:
-                    return json.loads(f.read().decode("utf-8"))
-            else:
-                # JSON file
-                with open(datafile_path, "r") as f:
-                    return json.load(f)
+            return _read_json(datafile_path, gz=(relpath.suffix == ".gz"))
         elif tgz_path.exists():
-            with tarfile.open(tgz_path, "r:gz") as f:
-                membername = str(pathlib.Path(parent_dir.name) / relpath)
-                with f.extractfile(membername) as g:
-                    if relpath.suffix == ".gz":
-                        # gzipped JSON file
-                        return json.loads(gzip.open(g).read().decode("utf-8"))
-                    else:
-                        # JSON file
-                        return json.load(g)
+            abspath = os.path.abspath(tgz_path)
+            st = os.stat(abspath)
+            args = (
+                abspath,
+                st.st_ino,
+                st.st_mtime_ns,
+                st.st_size,
+                str(pathlib.Path(parent_dir.name) / relpath),
+                relpath.suffix == ".gz",
+            )
+            # gzipped members, such as sampled data, and large members are not cached
+            if (
+                relpath.suffix == ".gz"
+                or _tgz_member_size(*args[:5]) > _CACHE_MAX_FILE_SIZE
+            ):
+                data = _read_tgz_member.__wrapped__(*args)
+            else:
+                data = _read_tgz_member(*args)
+            return _loads(data)
         else:
             if not quiet:
                 print(printpathstr(datafile_path) + ": does not exist, skipping")
@@ -97,14 +211,10 @@ def read_contents(
 
 def read_optional(path: pathlib.Path, default: Any = None, gz: bool = False):
     path = pathlib.Path(path)
-    if path.exists():
-        if gz is True:
-            with gzip.open(path, "r") as f:
-                return json.loads(f.read().decode("utf-8"))
-        else:
-            with open(path, "r") as f:
-                return json.load(f)
-    return default
+    try:
+        return _read_json(path, gz=gz)
+    except FileNotFoundError:
+        return default
 
 
 def read_cascading(paths: list[pathlib.Path], quiet: bool = False, gz: bool = False):
@@ -129,10 +239,10 @@ def dump(
     def _write(data, path: pathlib.Path, gz: bool = False):
         path.parent.mkdir(parents=True, exist_ok=True)
         if gz is True:
-            with gzip.open(path, "w") as f:
-                f.write(json.dumps(data).encode("utf-8"))
+            with gzip.open(path, "wb", compresslevel=_GZ_COMPRESSLEVEL) as f:
+                _write_compact_json(data, f)
         else:
-            with open(path, "w") as f:
+            with open(path, "w", buffering=_WRITE_BUFFER_SIZE) as f:
                 json.dump(data, f)
 
     path = pathlib.Path(path)
@@ -158,31 +268,45 @@ def safe_dump(
 ):
     """Json dump with overwrite/skipping/write output messaging
 
-    Writes to the temporary file `path + ".tmp"`, then removes `path`
-    and renames the temporary file, to avoid losing the original file
-    without writing the new file. This method does not avoid race
-    conditions.
+    Writes to the temporary file `path + ".tmp"`, then replaces `path`
+    with the temporary file using `os.replace`, to avoid losing the original
+    file without writing the new file.
 
-    If the temporary file already exists an exception is raised.
+    If the temporary file already exists an exception is raised. The temporary
+    file is created exclusively, so concurrent writers to the same path cannot
+    both write it.
+
+    If writing fails, the temporary file is removed and `path` is left unchanged.
+
+    Gzipped files are written as compact JSON. Otherwise files are written as
+    pretty-printed JSON.
     """
     path = pathlib.Path(path)
 
     def _safe_write(data, path, gz: bool = False):
         path.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = pathlib.Path(str(path) + ".tmp")
-        if tmp_path.exists():
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        try:
+            fd = os.open(tmp_path, flags, 0o666)
+        except FileExistsError:
             raise Exception("Error: " + str(tmp_path) + " already exists")
 
-        if gz is True:
-            with gzip.open(tmp_path, "w") as f:
-                f.write(xtal.pretty_json(data).encode("utf-8"))
-        else:
-            with open(tmp_path, "w") as f:
-                f.write(xtal.pretty_json(data))
-
-        if path.exists():
-            path.unlink()
-        tmp_path.rename(path)
+        try:
+            if gz is True:
+                with os.fdopen(fd, "wb") as f:
+                    with gzip.GzipFile(
+                        fileobj=f, mode="wb", compresslevel=_GZ_COMPRESSLEVEL
+                    ) as g:
+                        _write_compact_json(data, g)
+            else:
+                with os.fdopen(fd, "w") as f:
+                    f.write(xtal.pretty_json(data))
+            os.replace(tmp_path, path)
+        except BaseException:
+            # do not leave a temporary file that would block the next attempt
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     if path.exists():
         if force:
@@ -3,9 +3,11 @@ import time
 from contextlib import redirect_stdout
 
 import numpy as np
+import pytest
 
 import casm.project
 import libcasm.clexulator
+from libcasm.clusterography import Cluster
 
 
 def test_bset_periodic_1(SiGe_occ_tmp_project):
@@ -74,6 +76,7 @@ def test_bset_periodic_1(SiGe_occ_tmp_project):
     assert isinstance(clexulator, libcasm.clexulator.Clexulator)
     elapsed = time.time() - start
     print(f"elapsed time: {elapsed}")
+    assert bset.make_clexulator() is clexulator
 
     ## Print ##
     f = io.StringIO()
@@ -82,10 +85,21 @@ def test_bset_periodic_1(SiGe_occ_tmp_project):
     out = f.getvalue()
     print(out)
     assert "id" in out
-    assert "n_functions" in out
+    assert f"n_functions: {clexulator.n_functions()}" in out
     assert "n_variables" in out
     assert "n_update_neighborhood_sites" in out
 
+    ## Cluster data ##
+    assert bset.out.n_functions == clexulator.n_functions()
+    cluster_size = bset.out.cluster_size
+    assert cluster_size.shape == (clexulator.n_functions(),)
+    assert np.array_equal(cluster_size, [len(x) for x in bset.out.prototype_clusters])
+    assert bset.out.cluster_multiplicity.shape == (clexulator.n_functions(),)
+
+    ## No local basis set data ##
+    assert bset.out.local_src_path is None
+    assert bset.out.local_variables(0) is None
+
     ## Enum ##
     enum_id = "occ_by_supercell.1"
     enum = project.enum.get(enum_id)
@@ -110,3 +124,72 @@ def test_bset_periodic_1(SiGe_occ_tmp_project):
     print(out)
     assert "id" in out
     assert "n_functions" not in out
+
+
+def test_bset_id(SiGe_occ_tmp_project):
+    project = SiGe_occ_tmp_project
+
+    for bset_id in ["default", "bset_1", "A"]:
+        bset = project.bset.get(bset_id)
+        assert bset.id == bset_id
+
+    for bset_id in ["bad name!", "", "a.b", "../default", "default\n"]:
+        with pytest.raises(Exception, match="not a valid basis set name"):
+            project.bset.get(bset_id)
+
+
+def test_bset_local_parallel_compile(SiGe_occ_tmp_project):
+    project = SiGe_occ_tmp_project
+    bset_id = "local_nn"
+
+    # nearest neighbor pair phenomenal cluster, which has 4 equivalents
+    phenomenal = Cluster.from_dict(
+        data={"sites": [[0, 0, 0, 0], [1, 0, 0, 0]]},
+        xtal_prim=project.prim.xtal_prim,
+    )
+
+    bset = project.bset.get(bset_id)
+    bset.make_bspecs(
+        phenomenal=phenomenal,
+        max_length=[0.0, 0.0, 3.0],
+        cutoff_radius=[0.0, 3.0, 3.0],
+        occ_site_basis_functions_specs="occupation",
+    )
+    bset.commit()
+    bset.update(no_compile=True)
+    local_src_path = bset.out.local_src_path
+    assert len(local_src_path) > 1
+
+    ## Local basis set data ##
+    assert isinstance(bset.out.equivalents_info, dict)
+    for i_equiv in range(len(local_src_path)):
+        assert isinstance(bset.out.local_variables(i_equiv), dict)
+    assert bset.out.local_variables(len(local_src_path)) is None
+
+    so_paths = [p.with_suffix(".so") for p in local_src_path]
+    assert not any(p.exists() for p in so_paths)
+
+    ## Compile the equivalent local clexulators in 2 worker processes ##
+    bset._compile_local_clexulators(n_jobs=2)
+    assert all(p.exists() for p in so_paths)
+    mtimes = [p.stat().st_mtime_ns for p in so_paths]
+
+    ## The worker-built libraries are loaded, not re-compiled ##
+    local_clexulator = bset.make_local_clexulator()
+    assert isinstance(local_clexulator, libcasm.clexulator.LocalClexulator)
+    assert [p.stat().st_mtime_ns for p in so_paths] == mtimes
+
+    bset.update(only_compile=True, n_jobs=2)
+    assert [p.stat().st_mtime_ns for p in so_paths] == mtimes
+
+    ## The local libraries are recorded as generated files ##
+    generated = bset.out.generated_files["all"]
+    for p in so_paths:
+        assert str(p.relative_to(bset.bset_dir)) in generated
+
+    ## Regenerating removes and re-compiles the local libraries ##
+    bset.clean()
+    assert not any(p.exists() for p in so_paths)
+    bset.update(n_jobs=2)
+    assert all(p.exists() for p in so_paths)
+    assert [p.stat().st_mtime_ns for p in so_paths] != mtimes
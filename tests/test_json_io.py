@@ -0,0 +1,178 @@
+import concurrent.futures
+import gzip
+import json
+import math
+import os
+import tarfile
+
+import pytest
+
+import casm.project.json_io as json_io
+from casm.project.json_io import (
+    dump,
+    read_contents,
+    read_optional,
+    read_required,
+    safe_dump,
+)
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "json"])
+def use_orjson(request, monkeypatch):
+    if request.param is True:
+        if json_io.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(json_io, "orjson", None)
+    return request.param
+
+
+def test_json_io_roundtrip(tmp_path, use_orjson):
+    data = {"a": [1, 2.5, "x", None, True], "b": {"c": {"d": []}}}
+
+    dump(data, tmp_path / "dump.json", quiet=True)
+    assert read_required(tmp_path / "dump.json") == data
+
+    dump(data, tmp_path / "dump.json.gz", quiet=True, gz=True)
+    assert read_required(tmp_path / "dump.json.gz", gz=True) == data
+
+    safe_dump(data, tmp_path / "safe_dump.json", quiet=True)
+    assert read_required(tmp_path / "safe_dump.json") == data
+
+    safe_dump(data, tmp_path / "safe_dump.json.gz", quiet=True, gz=True)
+    assert read_required(tmp_path / "safe_dump.json.gz", gz=True) == data
+
+    assert read_optional(tmp_path / "missing.json", default=1) == 1
+    with pytest.raises(Exception, match="does not exist"):
+        read_required(tmp_path / "missing.json")
+
+
+def test_json_io_gz_output_does_not_depend_on_orjson(tmp_path, use_orjson):
+    data = {"nan": float("nan"), "inf": float("inf"), "big": 2**70, 1: "one"}
+
+    safe_dump(data, tmp_path / "data.json.gz", quiet=True, gz=True)
+    with gzip.open(tmp_path / "data.json.gz", "rb") as f:
+        assert f.read() == json.dumps(data).encode("utf-8")
+
+    result = read_required(tmp_path / "data.json.gz", gz=True)
+    assert math.isnan(result["nan"])
+    assert result["inf"] == float("inf")
+    assert result["big"] == 2**70
+    assert result["1"] == "one"
+
+
+def test_json_io_reread_after_rewrite(tmp_path, use_orjson):
+    path = tmp_path / "data.json"
+
+    dump({"value": 1}, path, quiet=True)
+    assert read_required(path) == {"value": 1}
+    dump({"value": 22}, path, force=True, quiet=True)
+    assert read_required(path) == {"value": 22}
+
+    safe_dump({"value": 333}, path, force=True, quiet=True)
+    assert read_required(path) == {"value": 333}
+    safe_dump({"value": 4444}, path, force=True, quiet=True)
+    assert read_required(path) == {"value": 4444}
+
+    # each read returns a new object
+    read_required(path)["value"] = 0
+    assert read_required(path) == {"value": 4444}
+
+
+def test_safe_dump_tmp_file_collision(tmp_path):
+    path = tmp_path / "data.json"
+    tmp_file = tmp_path / "data.json.tmp"
+    safe_dump({"value": 1}, path, quiet=True)
+    tmp_file.write_text("in use")
+
+    with pytest.raises(Exception, match="already exists"):
+        safe_dump({"value": 2}, path, force=True, quiet=True)
+
+    # the other writer's temporary file and the original file are untouched
+    assert tmp_file.read_text() == "in use"
+    assert read_required(path) == {"value": 1}
+
+
+def test_safe_dump_removes_tmp_file_on_error(tmp_path):
+    path = tmp_path / "data.json.gz"
+    safe_dump({"value": 1}, path, quiet=True, gz=True)
+
+    with pytest.raises(TypeError):
+        safe_dump({"value": object()}, path, force=True, quiet=True, gz=True)
+    assert not os.path.exists(str(path) + ".tmp")
+    assert read_required(path, gz=True) == {"value": 1}
+
+    safe_dump({"value": 2}, path, force=True, quiet=True, gz=True)
+    assert read_required(path, gz=True) == {"value": 2}
+
+
+def _make_tgz(run_dir, files):
+    """Write `files` (name -> data) to `run_dir`, then archive it to a .tgz"""
+    for name, data in files.items():
+        dump(data, run_dir / name, quiet=True, gz=name.endswith(".gz"))
+    tgz_path = run_dir.parent / (run_dir.name + ".tgz")
+    with tarfile.open(tgz_path, "w:gz") as tar:
+        tar.add(run_dir, arcname=run_dir.name)
+    for name in files:
+        (run_dir / name).unlink()
+    run_dir.rmdir()
+    return tgz_path
+
+
+def test_read_contents_tgz(tmp_path, use_orjson):
+    run_dir = tmp_path / "run.0"
+    files = {
+        "summary.json": {"n": 1},
+        "samples.json.gz": {"x": [1.0, 2.0, float("nan")]},
+    }
+
+    # read from the directory
+    for name, data in files.items():
+        dump(data, run_dir / name, quiet=True, gz=name.endswith(".gz"))
+    assert read_contents(run_dir, "summary.json") == {"n": 1}
+
+    # read from the archive
+    _make_tgz(run_dir, files)
+    assert not run_dir.exists()
+    assert read_contents(run_dir, "summary.json") == {"n": 1}
+    samples = read_contents(run_dir, "samples.json.gz")
+    assert samples["x"][:2] == [1.0, 2.0]
+    assert math.isnan(samples["x"][2])
+    assert read_contents(run_dir, "missing.json", default=0, quiet=True) == 0
+
+    # re-read after the archive is re-written
+    _make_tgz(run_dir, {"summary.json": {"n": 22}})
+    assert read_contents(run_dir, "summary.json") == {"n": 22}
+
+
+def test_read_contents_tgz_concurrent(tmp_path):
+    run_dir = tmp_path / "run.0"
+    files = {f"member_{i}.json": {"i": i, "x": [i] * 10000} for i in range(20)}
+    files.update({f"member_{i}.json.gz": {"i": i} for i in range(20)})
+    _make_tgz(run_dir, files)
+    json_io.clear_cache()
+
+    names = list(files) * 20
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda name: read_contents(run_dir, name), names))
+    for name, result in zip(names, results):
+        assert result == files[name]
+
+
+def test_read_contents_tgz_cache_size_limit(tmp_path, monkeypatch):
+    run_dir = tmp_path / "run.0"
+    files = {
+        "small.json": {"n": 1},
+        "large.json": {"x": list(range(1000))},
+        "small.json.gz": {"n": 2},
+    }
+    _make_tgz(run_dir, files)
+    monkeypatch.setattr(json_io, "_CACHE_MAX_FILE_SIZE", 100)
+    json_io.clear_cache()
+
+    for name, data in files.items():
+        assert read_contents(run_dir, name) == data
+        assert read_contents(run_dir, name) == data
+
+    # only the small, uncompressed member is cached
+    assert json_io._read_tgz_member.cache_info().currsize == 1